@@ -1,19 +1,49 @@
 import os
+
+# When running on gevent outside of gunicorn's gevent worker (which patches on its own),
+# set GEVENT=1 so the standard library is patched before requests is imported and
+# blocking vendor lookups yield to other requests instead of stalling the process.
+if os.environ.get('GEVENT'):
+    from gevent import monkey
+    monkey.patch_all()
+
 import requests
-from flask import Flask, request, jsonify, redirect, url_for, session, send_file
-from flask_session import Session
-from requests_oauthlib import OAuth2Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, request, redirect, url_for, session, send_file
 from google_auth_oauthlib.flow import Flow
+from google.auth import jwt as google_jwt
 import json
+import orjson
+import codecs
 import functools
+import gzip
+import hashlib
 import io
+import threading
+import socket
+import time
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 from flask_cors import CORS
-from bs4 import BeautifulSoup
+from lxml import etree
 import re
+import string
+import html
+import itertools
+import types
 
 app = Flask(__name__)
 CORS(app) # Enable CORS for client-side JavaScript access
 
+def ojsonify(obj, status=200):
+    """
+    Drop-in replacement for flask.jsonify that serializes with orjson, which writes the
+    JSON bytes directly and is several times faster than the standard library encoder.
+    """
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
 # --- GOOGLE SSO CONFIGURATION ---
 # NOTE: Replace these with your actual keys and secret key!
 # For security, these should be set as environment variables on Render.
@@ -21,11 +51,22 @@ GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.environ.get("GOOGLE_CLIENT_SECRET")
 GOOGLE_DISCOVERY_URL = "https://accounts.google.com/.well-known/openid-configuration"
 
+# Public base URL of this server, read once (environment variables don't change after startup)
+API_BASE_URL = os.environ.get("API_BASE_URL", "").rstrip('/')
+# With a configured base URL the OAuth redirect URI is fixed; otherwise it is built per request
+GOOGLE_REDIRECT_URI = f"{API_BASE_URL}/google/callback" if API_BASE_URL else None
+
 # Flask Session Configuration
-app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", os.urandom(24))
-app.config["SESSION_TYPE"] = "filesystem" # Use filesystem for simplicity on Render
-app.config["SESSION_PERMANENT"] = False
-Session(app)
+# The session only holds the user's email and name, so it lives in Flask's signed cookie
+# instead of server-side storage that would be read from disk on every request.
+# SECRET_KEY must be set under gunicorn (see Procfile), which runs several workers: each
+# worker would otherwise sign cookies with its own random key and reject sessions created
+# by the others, bouncing logins between workers. Gunicorn sets SERVER_SOFTWARE.
+if not os.environ.get("SECRET_KEY"):
+    if os.environ.get("SERVER_SOFTWARE", "").startswith("gunicorn"):
+        raise RuntimeError("SECRET_KEY must be set when running under gunicorn.")
+    app.logger.warning("SECRET_KEY is not set; sessions will not survive restarts.")
+app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY") or os.urandom(24)
 
 # Google OAuth Scopes
 SCOPES = [
@@ -34,31 +75,65 @@ SCOPES = [
     "openid"
 ]
 
+# OAuth client configuration, built once. The redirect URI depends on the request,
+# so it is passed to the Flow separately.
+_GOOGLE_CLIENT_CONFIG = {
+    "web": {
+        "client_id": GOOGLE_CLIENT_ID,
+        "client_secret": GOOGLE_CLIENT_SECRET,
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+        "javascript_origins": [API_BASE_URL] # Optional, for client-side use
+    }
+}
+
 # --- SSO UTILITY FUNCTIONS ---
 
 def get_google_auth_flow():
     """Initializes the Google OAuth flow."""
     # The redirect URI is dynamic based on the request, but the path is fixed
     # We use _scheme='https' to ensure the callback URL is secure, which Google requires
-    redirect_uri = url_for('callback', _external=True, _scheme='https')
+    redirect_uri = GOOGLE_REDIRECT_URI or url_for('callback', _external=True, _scheme='https')
     
     flow = Flow.from_client_config(
-        client_config={
-            "web": {
-                "client_id": GOOGLE_CLIENT_ID,
-                "client_secret": GOOGLE_CLIENT_SECRET,
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                "redirect_uris": [redirect_uri],
-                "javascript_origins": [os.environ.get("API_BASE_URL", "")] # Optional, for client-side use
-            }
-        },
+        client_config=_GOOGLE_CLIENT_CONFIG,
         scopes=SCOPES,
         redirect_uri=redirect_uri
     )
     return flow
 
+# Google's id_token signing certificates (key id -> PEM), cached so logins verify the
+# id_token locally instead of calling the userinfo endpoint
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+_GOOGLE_CERTS = TTLCache(maxsize=1, ttl=3600)
+_GOOGLE_CERTS_LOCK = threading.Lock()
+
+def _google_certs(refresh=False):
+    """Returns Google's current id_token signing certificates, fetching them at most hourly."""
+    with _GOOGLE_CERTS_LOCK:
+        certs = None if refresh else _GOOGLE_CERTS.get('certs')
+        if certs is None:
+            response = SESSION.get(GOOGLE_CERTS_URL, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            certs = _GOOGLE_CERTS['certs'] = orjson.loads(response.content)
+    return certs
+
+def verify_google_id_token(token):
+    """
+    Verifies a Google id_token's signature, audience, expiry and issuer, and returns its claims.
+    Raises ValueError if the token is invalid.
+    """
+    try:
+        claims = google_jwt.decode(token, certs=_google_certs(), audience=GOOGLE_CLIENT_ID)
+    except ValueError:
+        # Google may have rotated its signing keys since the certificates were cached
+        claims = google_jwt.decode(token, certs=_google_certs(refresh=True), audience=GOOGLE_CLIENT_ID)
+    if claims.get('iss') not in GOOGLE_ISSUERS:
+        raise ValueError(f"Wrong issuer: {claims.get('iss')}")
+    return claims
+
 def login_required(f):
     """Decorator to protect routes."""
     @functools.wraps(f)
@@ -98,13 +173,15 @@ def callback():
 
     # Get user info
     credentials = flow.credentials
-    # We need to manually construct the session to get user info
-    google_session = OAuth2Session(GOOGLE_CLIENT_ID, token=credentials.token)
-    user_info = google_session.get('https://www.googleapis.com/oauth2/v1/userinfo').json()
+    # The signed id_token from the token exchange already carries the email and name
+    try:
+        user_info = verify_google_id_token(credentials.id_token)
+    except (ValueError, requests.exceptions.RequestException) as e:
+        return f"Token verification failed: {e}", 500
 
     # CRITICAL: Check if the user is part of the VVISD domain
     # This assumes your district email is @vvisd.org
-    if not user_info.get('email', '').endswith('@vvisd.org'):
+    if not user_info.get('email_verified') or not user_info.get('email', '').endswith('@vvisd.org'):
         return "Access Denied: You must log in with a @vvisd.org account.", 403
 
     # Store user info in session
@@ -122,6 +199,49 @@ def logout():
 
 # --- SECURE FILE SERVING ---
 
+# Assuming index.html is in the same directory
+INDEX_PATH = 'index.html'
+_USER_NAME_PLACEHOLDER = '__USER_NAME__'
+_API_BASE_URL_PLACEHOLDER = '__API_BASE_URL__'
+# (mtime, template) of the last index.html read; re-read only when the file changes
+_index_template = (None, None)
+
+def _load_index_template():
+    """
+    Returns index.html with placeholders for the per-request values, reading and
+    preparing the file only when its modification time has changed.
+    Raises FileNotFoundError if index.html is missing.
+    """
+    global _index_template
+    mtime = os.stat(INDEX_PATH).st_mtime
+    cached_mtime, template = _index_template
+    if mtime != cached_mtime:
+        with open(INDEX_PATH, 'r') as f:
+            template = f.read()
+        # Simple template replacement to show the user's name
+        template = template.replace(
+            'Van Vleck ISD - Technology Inventory',
+            f'Van Vleck ISD - Inventory ({_USER_NAME_PLACEHOLDER})'
+        )
+        # The client-side code will be updated to look for this injected value
+        template = template.replace(
+            "state.dellApiUrl = 'https://YOUR_DEPLOYED_API_URL';",
+            f"state.dellApiUrl = '{_API_BASE_URL_PLACEHOLDER}';"
+        )
+        _index_template = (mtime, template)
+    return template
+
+@functools.lru_cache(maxsize=256)
+def _render_index(template, user_name, api_base_url):
+    """
+    Fills in the per-user values of the index.html template. Returns (body, gzipped body, etag);
+    cached, since the page only changes with the template, user and API base URL.
+    """
+    body = template.replace(
+        _USER_NAME_PLACEHOLDER, user_name
+    ).replace(_API_BASE_URL_PLACEHOLDER, api_base_url).encode('utf-8')
+    return body, gzip.compress(body, compresslevel=6), hashlib.md5(body).hexdigest()
+
 @app.route('/')
 @app.route('/app')
 @login_required
@@ -129,164 +249,670 @@ def serve_app():
     """Serves the index.html file only if the user is logged in."""
     # The index.html file is now read and served by the server
     try:
-        # Assuming index.html is in the same directory
-        with open('index.html', 'r') as f:
-            html_content = f.read()
-        
-        # Simple template replacement to show the user's name
-        html_content = html_content.replace(
-            'Van Vleck ISD - Technology Inventory', 
-            f'Van Vleck ISD - Inventory ({session.get("user_name", "Guest")})'
-        )
-        
-        # Inject the base URL of the API into the client-side code
-        # This is CRITICAL because the client-side lookups must now use the server's base URL
-        api_base_url = os.environ.get("API_BASE_URL", request.url_root.rstrip('/'))
-        
-        # The client-side code will be updated to look for this injected value
-        html_content = html_content.replace(
-            "state.dellApiUrl = 'https://YOUR_DEPLOYED_API_URL';",
-            f"state.dellApiUrl = '{api_base_url}';"
-        )
-        
-        return html_content, 200, {'Content-Type': 'text/html'}
+        template = _load_index_template()
     except FileNotFoundError:
         return "Error: index.html not found on the server.", 500
 
-# --- PROTECT ALL LOOKUP ROUTES ---
-# We will apply the @login_required decorator to all existing lookup routes below.
+    # Inject the base URL of the API into the client-side code
+    # This is CRITICAL because the client-side lookups must now use the server's base URL
+    api_base_url = API_BASE_URL or request.url_root.rstrip('/')
+
+    body, gzipped, etag = _render_index(template, session.get("user_name", "Guest"), api_base_url)
+
+    # Returning visitors revalidate with If-None-Match and get an empty 304 while the page is unchanged
+    if request.accept_encodings['gzip'] > 0: # Quality value; 0 for absent or gzip;q=0
+        response = Response(gzipped, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(etag + '-gzip')
+    else:
+        response = Response(body, mimetype='text/html')
+        response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+# --- SHARED HTTP SESSION ---
+# A single pooled session lets repeated lookups to the same vendor host reuse
+# keep-alive connections instead of paying a fresh TCP + TLS handshake per request.
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+# The adapter owns the connection pool. Gateway errors are retried, but once retries run
+# out the final 5xx response is returned (raise_on_status=False) so it still reaches
+# raise_for_status() and the circuit breaker's status check.
+HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+)
+SESSION.mount('https://', HTTP_ADAPTER)
+SESSION.mount('http://', HTTP_ADAPTER)
+
+# (connect, read) timeouts for vendor page requests
+REQUEST_TIMEOUT = (3.05, 10)
+
+# --- VENDOR DNS CACHE ---
+# Cold connections to a vendor host otherwise pay a DNS lookup each time the pool
+# opens a new socket. Resolutions for the scraped vendor hosts are kept for a few
+# minutes (so IP changes are still picked up); every other host resolves normally.
+VENDOR_HOSTS = frozenset({
+    'www.dell.com',
+    'support.hp.com',
+    'pcsupport.lenovo.com',
+    'www.acer.com',
+    'www.viewsonic.com',
+    'mybusinessservice.surface.com',
+})
+DNS_CACHE = TTLCache(maxsize=256, ttl=300)
+_DNS_LOCK = threading.Lock()
+_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo with a short-lived cache for VENDOR_HOSTS."""
+    if host not in VENDOR_HOSTS:
+        return _getaddrinfo(host, port, family, type, proto, flags)
+    key = (host, port, family, type, proto, flags)
+    with _DNS_LOCK:
+        addrinfo = DNS_CACHE.get(key)
+    if addrinfo is None:
+        addrinfo = _getaddrinfo(host, port, family, type, proto, flags)
+        with _DNS_LOCK:
+            DNS_CACHE[key] = addrinfo
+    return addrinfo
+
+socket.getaddrinfo = _cached_getaddrinfo
+
+# --- UPSTREAM CIRCUIT BREAKERS ---
+# When a vendor site is down, every lookup would otherwise wait out the full request
+# timeout and tie up a worker. After BREAKER_FAIL_MAX consecutive failures the host's
+# breaker opens and lookups fail fast; after BREAKER_RESET_TIMEOUT seconds a single
+# trial request is let through to see whether the host has recovered.
+BREAKER_FAIL_MAX = 5
+BREAKER_RESET_TIMEOUT = 60
+
+class UpstreamUnavailable(requests.exceptions.ConnectionError):
+    """Raised instead of fetching while a vendor host's circuit breaker is open."""
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for a single upstream host."""
+
+    def __init__(self, fail_max=BREAKER_FAIL_MAX, reset_timeout=BREAKER_RESET_TIMEOUT):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Returns True if a request may be sent to the host."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_timeout:
+                self._opened_at = now # Half-open: let one trial request through
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+_BREAKERS = {host: CircuitBreaker() for host in VENDOR_HOSTS}
+
+def _get_page(url):
+    """
+    Starts a streamed GET of a vendor page through SESSION, guarded by the host's circuit
+    breaker. Returns the response (use it as a context manager); raises UpstreamUnavailable
+    without sending anything while the breaker is open.
+    """
+    breaker = _BREAKERS[urlsplit(url).hostname]
+    if not breaker.allow():
+        raise UpstreamUnavailable("Upstream temporarily unavailable.")
+    try:
+        response = SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT)
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.RetryError):
+        breaker.record_failure()
+        raise
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+# --- LOOKUP RESULT CACHE ---
+# Scraped (model_name, message) results keyed by (function name, serial number).
+# Successful lookups are kept for a day; failed lookups only for a few minutes so a
+# transient vendor error doesn't get pinned. Tags the vendor answered with a 404 are
+# valid-looking but unknown, and won't start existing soon, so they are kept for a week.
+LOOKUP_CACHE = TTLCache(maxsize=10_000, ttl=86400)
+NEG_CACHE = TTLCache(maxsize=10_000, ttl=300)
+NOT_FOUND_CACHE = TTLCache(maxsize=100_000, ttl=7 * 86400)
+_CACHE_LOCK = threading.RLock() # TTLCache is not thread-safe
+CACHE_STATS = {'hits': 0, 'misses': 0} # Guarded by _CACHE_LOCK
+
+# Optional on-disk tier behind the in-memory caches, enabled by pointing LOOKUP_CACHE_DIR
+# at a writable directory. It is SQLite-backed, so it survives worker restarts and is
+# shared by all gunicorn workers on the host. Only answers the vendor actually gave are
+# persisted; transient failures stay in the short-lived in-memory negative cache.
+LOOKUP_CACHE_DIR = os.environ.get('LOOKUP_CACHE_DIR')
+if LOOKUP_CACHE_DIR:
+    import diskcache
+    DISK_CACHE = diskcache.Cache(LOOKUP_CACHE_DIR, size_limit=2**30)
+else:
+    DISK_CACHE = None
+DISK_TTL = 30 * 86400
+DISK_NOT_FOUND_TTL = 7 * 86400
+
+class NotFound(str):
+    """
+    A scraper's error message for a tag the vendor answered with a 404. ttl_memo keeps these
+    results in the long-lived not-found tier by type, so the wording can change freely.
+    """
+    __slots__ = ()
 
-# Dell Service Tag validation regex (7-character alphanumeric)
-SERVICE_TAG_REGEX = re.compile(r"^[a-zA-Z0-9]{7}$")
+# Messages returned by the scrapers when the vendor page is a 404
+SERIAL_NOT_FOUND = NotFound("Serial Number found, but product page not found (404). It might be too old or invalid.")
+SERVICE_TAG_NOT_FOUND = NotFound("Service Tag found, but product page not found (404). It might be too old or invalid.")
 
-# HP Serial Number validation regex (10-12 alphanumeric characters)
-HP_SERIAL_REGEX = re.compile(r"^[a-zA-Z0-9]{10,12}$")
+def ttl_memo(cache, negative_cache=NEG_CACHE, not_found_cache=NOT_FOUND_CACHE, disk_cache=DISK_CACHE):
+    """
+    Decorator that memoizes a scraper's (model_name, message) result in TTL caches,
+    falling back to the on-disk tier (when configured) before scraping.
 
-# ViewSonic Serial Number validation regex (10-12 alphanumeric characters)
-VIEWSONIC_SERIAL_REGEX = re.compile(r"^[a-zA-Z0-9]{10,12}$")
+    Any result with a model name is cached as a success (a day in memory, 30 days on disk),
+    so a memoized scraper must return (None, error) when the fetch fails. Fallback guesses
+    made on failure belong in an uncached wrapper (see get_acer_model_name).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(serial_number):
+            key = (func.__name__, serial_number)
+            with _CACHE_LOCK:
+                result = cache.get(key) or not_found_cache.get(key) or negative_cache.get(key)
+            if result is None and disk_cache is not None:
+                result = disk_cache.get(key)
+                if result is not None:
+                    with _CACHE_LOCK:
+                        (cache if result[0] else not_found_cache)[key] = result
+            with _CACHE_LOCK:
+                CACHE_STATS['misses' if result is None else 'hits'] += 1
+            if result is not None:
+                return result
+
+            result = func(serial_number)
+            with _CACHE_LOCK:
+                if result[0]:
+                    cache[key] = result
+                elif isinstance(result[1], NotFound):
+                    not_found_cache[key] = result
+                else:
+                    negative_cache[key] = result
+            if disk_cache is not None:
+                if result[0]:
+                    disk_cache.set(key, result, expire=DISK_TTL)
+                elif isinstance(result[1], NotFound):
+                    disk_cache.set(key, result, expire=DISK_NOT_FOUND_TTL)
+            return result
+        return wrapper
+    return decorator
+
+# In-flight scrapes keyed by (function name, serial number) -> (done event, result holder).
+# Concurrent cache misses for the same serial wait on the first caller's fetch
+# instead of each hitting the vendor site.
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+def collapse(func):
+    """Decorator that coalesces concurrent calls for the same serial number into a single call."""
+    @functools.wraps(func)
+    def wrapper(serial_number):
+        key = (func.__name__, serial_number)
+        with _INFLIGHT_LOCK:
+            inflight = _INFLIGHT.get(key)
+            if inflight is None:
+                inflight = _INFLIGHT[key] = (threading.Event(), [])
+                leader = True
+            else:
+                leader = False
+
+        done, holder = inflight
+        if not leader:
+            done.wait()
+            if holder:
+                return holder[0]
+            # The leading call raised; do the lookup ourselves
+            return func(serial_number)
+
+        try:
+            result = func(serial_number)
+            holder.append(result)
+            return result
+        finally:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[key]
+            done.set()
+    return wrapper
 
-# Juniper Serial Number validation regex (typically 12 alphanumeric characters)
-JUNIPER_SERIAL_REGEX = re.compile(r"^[a-zA-Z0-9]{12}$")
+# --- PROTECT ALL LOOKUP ROUTES ---
+# We will apply the @login_required decorator to all existing lookup routes below.
 
-# CyberPower Serial Number validation regex (typically 12 or 16 alphanumeric characters)
-CYBERPOWER_SERIAL_REGEX = re.compile(r"^[a-zA-Z0-9]{12}$|^[a-zA-Z0-9]{16}$")
+# Serial number / service tag validation regexes, keyed by vendor.
+# Tags are validated as received and only upper-cased afterwards, so patterns are
+# case-insensitive. re.ASCII keeps IGNORECASE from folding non-ASCII look-alikes
+# (e.g. the Kelvin sign) onto ASCII letters.
+VENDOR_REGEX = {
+    # Cisco Serial Number (Typically 11 characters: LLLYYWWXXXX)
+    'cisco': re.compile(r"\A[A-Z]{3}[0-9]{8}\Z", re.ASCII | re.IGNORECASE),
+}
+
+def _is_ascii_digits(s):
+    return s.isascii() and s.isdigit()
+
+def _is_ascii_alnum(s):
+    return s.isascii() and s.isalnum()
+
+# Vendors with a single fixed serial length skip the regex engine entirely:
+# a length compare plus two C-level scans of the string.
+FIXED_LENGTHS = {
+    # Dell Service Tag (7-character alphanumeric)
+    'dell': 7,
+    # Juniper Serial Number (typically 12 alphanumeric characters)
+    'juniper': 12,
+    # Brother Serial Number (typically 15 alphanumeric characters)
+    'brother': 15,
+    # APC Serial Number (Typically 12 characters)
+    'apc': 12,
+    # Vizio Serial Number (typically 14 characters)
+    'vizio': 14,
+}
+
+def _fixed_length_validator(length):
+    def valid(s):
+        return len(s) == length and _is_ascii_alnum(s)
+    return valid
+
+# Same for vendors whose alphanumeric serials come in a contiguous range of lengths
+LENGTH_RANGES = {
+    # HP Serial Number (10-12 alphanumeric characters)
+    'hp': (10, 12),
+    # ViewSonic Serial Number (10-12 alphanumeric characters)
+    'viewsonic': (10, 12),
+    # Lenovo Serial Number (typically 8-12 alphanumeric characters)
+    'lenovo': (8, 12),
+    # TCL Serial Number (typically 12-14 characters)
+    'tcl': (12, 14),
+}
+
+def _length_range_validator(min_len, max_len):
+    def valid(s):
+        return min_len <= len(s) <= max_len and _is_ascii_alnum(s)
+    return valid
+
+# Vendors whose serials come in several fixed lengths are validated with an explicit
+# length check plus a single alphanumeric scan, instead of a regex alternation that is
+# retried branch by branch on a mismatch.
+APPLE_LENGTHS = frozenset({12, 17})
+CYBERPOWER_LENGTHS = frozenset({12, 16})
+SAMSUNG_LENGTHS = frozenset({11, 15})
+
+def _valid_apple(s):
+    # Apple Serial Number (12 or 17 alphanumeric characters)
+    return len(s) in APPLE_LENGTHS and _is_ascii_alnum(s)
+
+def _valid_cyberpower(s):
+    # CyberPower Serial Number (typically 12 or 16 alphanumeric characters)
+    return len(s) in CYBERPOWER_LENGTHS and _is_ascii_alnum(s)
+
+def _valid_samsung(s):
+    # Samsung Serial Number (typically 11 or 15 characters)
+    return len(s) in SAMSUNG_LENGTHS and _is_ascii_alnum(s)
+
+def _valid_acer(s):
+    # Acer Serial Number (22 alphanumeric characters, or 11/12 digit SNID)
+    if len(s) == 22:
+        return _is_ascii_alnum(s)
+    return 11 <= len(s) <= 12 and _is_ascii_digits(s)
+
+def _valid_microsoft(s):
+    # Microsoft Serial Number (typically 12 digits/letters, or 16 digits)
+    if len(s) == 12:
+        return _is_ascii_alnum(s)
+    return len(s) == 16 and _is_ascii_digits(s)
+
+# Vendor -> predicate used by validate()
+VENDOR_VALIDATORS = {vendor: regex.match for vendor, regex in VENDOR_REGEX.items()}
+VENDOR_VALIDATORS.update({vendor: _fixed_length_validator(n) for vendor, n in FIXED_LENGTHS.items()})
+VENDOR_VALIDATORS.update({vendor: _length_range_validator(*bounds) for vendor, bounds in LENGTH_RANGES.items()})
+VENDOR_VALIDATORS.update({
+    'apple': _valid_apple,
+    'cyberpower': _valid_cyberpower,
+    'samsung': _valid_samsung,
+    'acer': _valid_acer,
+    'microsoft': _valid_microsoft,
+})
+
+# ASCII-only upper-casing table. Unlike str.upper(), non-ASCII characters are left as-is
+# (str.upper() expands e.g. the 'ﬁ' ligature to 'FI'), so they still fail validation.
+_UPPER_ASCII_TABLE = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+def _normalize(tag):
+    """Upper-cases a validated tag's ASCII letters. All routes normalize through here after validate()."""
+    if tag.isupper() or tag.isdigit():
+        return tag # Nothing to upper-case; skip building a new string
+    return tag.translate(_UPPER_ASCII_TABLE)
+
+def validate(vendor, tag):
+    """
+    Returns True if the tag matches the serial number format for the given vendor.
+    Case-insensitive, so routes validate the raw tag and upper-case it only on success.
+    Routes validate once here; the get_*_model_name helpers assume a validated tag.
+    """
+    return bool(VENDOR_VALIDATORS[vendor](tag))
 
-# Brother Serial Number validation regex (typically 15 alphanumeric characters)
-BROTHER_SERIAL_REGEX = re.compile(r"^[a-zA-Z0-9]{15}$")
+# --- SCRAPER SELECTORS ---
+# Compiled once at import. Each scraper's fallback selectors are combined into a single
+# XPath predicate that is tested against elements as they stream in from the page;
+# the first match in document order wins.
 
-# Apple Serial Number validation regex (12 or 17 alphanumeric characters)
-APPLE_SERIAL_REGEX = re.compile(r"^[a-zA-Z0-9]{12}$|^[a-zA-Z0-9]{17}$")
+def _has_class(name):
+    """XPath predicate matching an element whose class list contains `name` (like BeautifulSoup's class_=)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
 
-# Acer Serial Number validation regex (22 alphanumeric characters, or 11/12 digit SNID)
-ACER_SERIAL_REGEX = re.compile(r"^[a-zA-Z0-9]{22}$|^\d{11,12}$")
+_DELL_MATCH = etree.XPath(f"self::h1[{_has_class('product-name')}] or self::span[@id='modelName']")
+_HP_MATCH = etree.XPath(f"self::h1[{_has_class('product-title')}] or self::span[{_has_class('product-name')}]")
+_LENOVO_MATCH = etree.XPath(f"self::span[{_has_class('product-name')}] or self::h2[{_has_class('product-name')}]")
+_ACER_MATCH = etree.XPath(f"self::h1[{_has_class('product-name')}] or self::h2[{_has_class('product-name')}]")
+_VIEWSONIC_MATCH = etree.XPath(f"self::h1[{_has_class('product-name')}] or self::span[{_has_class('model-name')}]")
 
-# Lenovo Serial Number validation regex (typically 8-12 alphanumeric characters)
-LENOVO_SERIAL_REGEX = re.compile(r"^[a-zA-Z0-9]{8,12}$")
+def _element_text_re(*selectors):
+    """
+    Bytes-regex counterpart of the XPath predicates above, run on the raw head of the page.
+    Matches the text of the first element for any of the (tag, attribute, value) selectors,
+    where the attribute is 'class' (value is one of the classes) or 'id'. Only elements whose
+    content is plain text match; anything with nested markup is left to the parser.
+    Tag and attribute names match in any case, as in HTML; values are case-sensitive like
+    the XPath predicates, so both paths pick the same element.
+    """
+    alternatives = []
+    for tag, attr, value in selectors:
+        value = re.escape(value)
+        if attr == 'class':
+            value = rf'(?:[^"\'>]*\s)?{value}'
+        alternatives.append(
+            rf'<(?i:{tag})\s[^>]*?(?<![-\w])(?i:{attr})\s*=\s*["\']?{value}(?=[\s"\'>])[^>]*>([^<]+)</(?i:{tag})\s*>'
+        )
+    return re.compile('|'.join(alternatives).encode())
 
-# Cisco Serial Number validation regex (Typically 11 characters: LLLYYWWXXXX)
-CISCO_SERIAL_REGEX = re.compile(r"^[A-Z]{3}\d{8}$")
+_DELL_ELEMENT_RE = _element_text_re(('h1', 'class', 'product-name'), ('span', 'id', 'modelName'))
+_HP_ELEMENT_RE = _element_text_re(('h1', 'class', 'product-title'), ('span', 'class', 'product-name'))
+_LENOVO_ELEMENT_RE = _element_text_re(('span', 'class', 'product-name'), ('h2', 'class', 'product-name'))
+_ACER_ELEMENT_RE = _element_text_re(('h1', 'class', 'product-name'), ('h2', 'class', 'product-name'))
+_VIEWSONIC_ELEMENT_RE = _element_text_re(('h1', 'class', 'product-name'), ('span', 'class', 'model-name'))
 
-# APC Serial Number validation regex (Typically 12 characters)
-APC_SERIAL_REGEX = re.compile(r"^[A-Z0-9]{12}$")
+# Size of the chunks fed from the response body into the pull parser
+STREAM_CHUNK_SIZE = 4096
 
-# Microsoft Serial Number validation regex (typically 12 digits/letters)
-MICROSOFT_SERIAL_REGEX = re.compile(r"^[0-9]{12}$|^[0-9]{16}$|^[A-Z0-9]{12}$")
+# Pages advertising a larger body than this are skipped instead of downloaded
+MAX_PAGE_BYTES = 2_000_000
 
-# Samsung Serial Number validation regex (typically 11 or 15 characters)
-SAMSUNG_SERIAL_REGEX = re.compile(r"^[A-Z0-9]{11}$|^[A-Z0-9]{15}$")
+# At most this much of a page body is read, even when the vendor sends no Content-Length;
+# the model name is always near the top of the page
+MAX_SCAN_BYTES = 512 * 1024
 
-# Vizio Serial Number validation regex (typically 14 characters)
-VIZIO_SERIAL_REGEX = re.compile(r"^[A-Z0-9]{14}$")
+def _page_rejection(response):
+    """
+    Checks a streamed response's headers before any of the body is read. Returns an error
+    message if the page is not HTML (e.g. a redirect to a file or API) or too large to scrape,
+    otherwise None.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    if content_type and 'html' not in content_type:
+        return f"Vendor page did not return HTML (Content-Type: {content_type})."
+    content_length = response.headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > MAX_PAGE_BYTES:
+        return "Vendor page is too large to scrape."
+    return None
+
+# Raw-bytes <title> extraction, so a page whose title already names the model is never parsed
+_TITLE_RE = re.compile(rb'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+# How much of the page head to buffer for the raw-bytes <title> and element searches
+HEAD_SCAN_BYTES = 16384
+
+# Vendor-specific patterns extracting the model name from a page title
+_DELL_TITLE_RE = re.compile(r'Support for (.+?) \| Dell US') # "Support for <model> | Dell US"
+_HP_TITLE_RE = re.compile(r'(.+?)\s+\|\s+HP Product Information') # "<model> | HP Product Information"
+_VIEWSONIC_TITLE_RE = re.compile(r'ViewSonic\s+([A-Z0-9]+)\s+Product') # "ViewSonic IFP6550 Product Support"
+
+# Prefixes stripped from scraped model names
+_DELL_PREFIX_RE = re.compile(r'^Support for\s+', re.IGNORECASE)
+
+def _strip_hp_prefix(model_name):
+    """Removes a leading "HP " (any case, any whitespace) from a scraped model name."""
+    model_name = model_name.strip()
+    if model_name[:2].upper() == 'HP' and model_name[2:3].isspace():
+        model_name = model_name[2:].lstrip()
+    return model_name
+
+def _title_model(title, title_re):
+    """Returns the model name captured from a page title by `title_re`, or None."""
+    if not title or title_re is None:
+        return None
+    match = title_re.search(title)
+    if match:
+        return match.group(1).strip() or None
+    return None
+
+def _iter_closed_elements(chunks, encoding='utf-8'):
+    """Yields page elements as soon as their closing tag has been parsed from the streamed body chunks."""
+    try:
+        parser = etree.HTMLPullParser(events=('end',), encoding=encoding)
+    except LookupError:
+        parser = etree.HTMLPullParser(events=('end',), encoding='utf-8') # Charset libxml2 doesn't know
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            yield element
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        return # Empty body
+    for _, element in parser.read_events():
+        yield element
+
+def _iter_body(response):
+    """Yields the streamed response body in chunks, stopping after MAX_SCAN_BYTES."""
+    read = 0
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        yield chunk
+        read += len(chunk)
+        if read >= MAX_SCAN_BYTES:
+            return
+
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+def _page_encoding(response):
+    """
+    Returns the charset declared in the page's Content-Type header, or UTF-8 if there is none
+    (or it is unknown). response.encoding is not used: requests defaults text/html to ISO-8859-1.
+    """
+    declared = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    if declared:
+        try:
+            codecs.lookup(declared.group(1))
+            return declared.group(1)
+        except LookupError:
+            pass
+    return 'utf-8'
+
+def _decode_text(raw, encoding='utf-8'):
+    """Decodes raw text bytes captured from the page into a stripped string."""
+    return html.unescape(raw.decode(encoding, 'replace')).strip()
+
+def _scan_page(response, match, title_re=None, element_re=None):
+    """
+    Finds the model name on a streamed (stream=True) vendor page. Returns (model_name, from_title).
 
-# TCL Serial Number validation regex (typically 12-14 characters)
-TCL_SERIAL_REGEX = re.compile(r"^[A-Z0-9]{12,14}$")
+    The raw head of the page is searched first without parsing: for the <title> if `title_re`
+    is given (a matching title wins), then with `element_re` for a plain-text model element.
+    Otherwise the body is streamed through the HTML pull parser, stopping as soon as an element
+    matching the `match` predicate is complete, with the parsed title as a last resort.
+    """
+    encoding = _page_encoding(response)
+    chunks = _iter_body(response)
+    head = b''
+    if title_re is not None or element_re is not None:
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= HEAD_SCAN_BYTES:
+                break
+            if element_re is None and _TITLE_RE.search(head):
+                break
+
+        raw_title = _TITLE_RE.search(head) if title_re is not None else None
+        if raw_title:
+            model_name = _title_model(_decode_text(raw_title.group(1), encoding), title_re)
+            if model_name:
+                return model_name, True
 
+        raw_element = element_re.search(head) if element_re is not None else None
+        if raw_element:
+            model_name = _decode_text(raw_element.group(raw_element.lastindex), encoding)
+            if model_name:
+                return model_name, False
+
+    title = None
+    for element in _iter_closed_elements(itertools.chain((head,), chunks), encoding):
+        if element.tag == 'title':
+            if title is None:
+                title = ''.join(element.itertext())
+        elif match(element):
+            text = ''.join(element.itertext()).strip()
+            if text:
+                return text, False
+
+    model_name = _title_model(title, title_re)
+    return model_name, model_name is not None
+
+def _fetch_model(url, match, title_re=None, element_re=None):
+    """
+    Fetches a vendor page and finds the model name on it with _scan_page().
+    Returns (model_name, from_title, rejection), where `rejection` is the _page_rejection()
+    message for a page that was refused unread. requests exceptions (including HTTPError
+    for a 4xx/5xx status) propagate; see _request_error_message().
+    """
+    with _get_page(url) as response:
+        response.raise_for_status()
+        rejection = _page_rejection(response)
+        if rejection:
+            return None, False, rejection
+        model_name, from_title = _scan_page(response, match, title_re, element_re)
+    return model_name, from_title, None
+
+def _request_error_message(err, not_found_message=SERIAL_NOT_FOUND):
+    """Translates a requests exception raised by _fetch_model() into a scraper error message."""
+    if isinstance(err, requests.exceptions.HTTPError):
+        if err.response is not None and err.response.status_code == 404:
+            return not_found_message
+        return f"HTTP Error: {err}"
+    if isinstance(err, requests.exceptions.ConnectionError):
+        return f"Error Connecting: {err}"
+    if isinstance(err, requests.exceptions.Timeout):
+        return f"Timeout Error: {err}"
+    return f"An unexpected error occurred: {err}"
+
+# This mapping is highly speculative and based on public data.
+# It should be treated as a strong suggestion, not a definitive answer.
+APPLE_PREFIX = types.MappingProxyType({
+    # MacBooks (12-character serials)
+    "C02": "MacBook Pro (Inferred)",
+    "C03": "MacBook Air (Inferred)",
+    "C1M": "iMac (Inferred)",
+    "DCP": "Mac Mini (Inferred)",
+    # iPads/iPhones (17-character serials)
+    "F4H": "iPad Pro (Inferred)",
+    "F5K": "iPad Air (Inferred)",
+    "F9F": "iPhone (Inferred)",
+    "F9G": "iPhone (Inferred)",
+    "G0C": "Apple Watch (Inferred)",
+    "FTY": "iPod Touch (Inferred)",
+})
+
+@functools.lru_cache(maxsize=4096)
 def get_apple_model_name(serial_number):
     """
     Infers the Apple model name based on known serial number prefixes.
     This is based on community knowledge of Apple's serial number structure.
     """
-    if not APPLE_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Apple Serial Number format (must be 12 or 17 alphanumeric characters)."
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
+    # For 17-character serials, sometimes the 4th and 5th characters are also useful.
+    # No 5-character mappings are known yet; when there are, add a table checked here
+    # before APPLE_PREFIX.
+    # Example: F9F.. -> iPhone 13
+    # Example: F4H.. -> iPad Pro 11-inch (3rd generation)
 
     # Use the first 3 characters for the most common model family inference
-    prefix = serial_number[:3].upper()
-
-    # This mapping is highly speculative and based on public data.
-    # It should be treated as a strong suggestion, not a definitive answer.
-    prefix_to_model = {
-        # MacBooks (12-character serials)
-        "C02": "MacBook Pro (Inferred)",
-        "C03": "MacBook Air (Inferred)",
-        "C1M": "iMac (Inferred)",
-        "DCP": "Mac Mini (Inferred)",
-        # iPads/iPhones (17-character serials)
-        "F4H": "iPad Pro (Inferred)",
-        "F5K": "iPad Air (Inferred)",
-        "F9F": "iPhone (Inferred)",
-        "F9G": "iPhone (Inferred)",
-        "G0C": "Apple Watch (Inferred)",
-        "FTY": "iPod Touch (Inferred)",
-    }
+    prefix = serial_number[:3]
 
-    if prefix in prefix_to_model:
-        model = prefix_to_model[prefix]
+    model = APPLE_PREFIX.get(prefix)
+    if model is not None:
         return model, f"Model inferred from serial number prefix '{prefix}'. Please verify."
-    
-    # For 17-character serials, sometimes the 4th and 5th characters are also useful
-    if len(serial_number) == 17:
-        prefix5 = serial_number[:5].upper()
-        # Add more specific 5-character mappings here if needed
-        # Example: F9F.. -> iPhone 13
-        # Example: F4H.. -> iPad Pro 11-inch (3rd generation)
-        pass
-
 
     return None, "Could not infer Apple model from serial number prefix."
 
+@ttl_memo(LOOKUP_CACHE)
+@collapse
 def get_lenovo_model_name(serial_number):
     """
     Scrapes the Lenovo warranty lookup page to find the product model name.
     """
-    if not LENOVO_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Lenovo Serial Number format (must be 8-12 alphanumeric characters)."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # URL to scrape (Lenovo's official warranty lookup page)
     url = f"https://pcsupport.lenovo.com/us/en/warranty-lookup?key={serial_number}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-
         # Lenovo's model name is often found in the 'product-name' class or a similar structure
         # We look for the most specific element that contains the model name.
-        model_element = soup.find('span', class_='product-name') or soup.find('h2', class_='product-name')
-        
-        if model_element:
-            model_name = model_element.text.strip()
-            if model_name:
-                return model_name, "Model found via web scraping."
+        model_name, _, rejection = _fetch_model(url, _LENOVO_MATCH, element_re=_LENOVO_ELEMENT_RE)
+        if rejection:
+            return None, rejection
+        if model_name:
+            return model_name, "Model found via web scraping."
         
         # Fallback if scraping is blocked or structure changed
         return None, "Model name element not found on Lenovo support page."
 
-    except requests.exceptions.RequestException as e:
-        # Fallback to pattern matching if request fails (e.g., blocked)
-        return None, f"Request failed (Web scraping failed): {e}"
-
+    except requests.exceptions.RequestException as err:
+        return None, _request_error_message(err)
+
+# This mapping is highly speculative and based on common Cisco codes.
+# It should be treated as a strong suggestion, not a definitive answer.
+CISCO_PREFIX = (
+    # Common Cisco Manufacturing Locations (LLL) - often associated with product lines
+    ("FOX", "Cisco Product (Foxconn - Common for Switches/Routers)"),
+    ("FOC", "Cisco Product (China - Common for Switches/Routers)"),
+    ("JAE", "Cisco Product (Japan - Older/Specialized Gear)"),
+    ("JAB", "Cisco Product (Japan - Older/Specialized Gear)"),
+    ("KWC", "Cisco Product (Common for Access Points/Smaller Devices)"),
+    # You would typically need a much larger, proprietary database for accurate mapping
+    # For a simple inventory, we can only suggest the product family.
+)
+
+@functools.lru_cache(maxsize=4096)
 def get_cisco_model_name(serial_number):
     """
     Infers the Cisco model name based on known serial number prefixes.
     This is a pattern-matching logic based on community knowledge.
     """
-    if not CISCO_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Cisco Serial Number format (must be 11 characters: LLLYYWWXXXX)."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # Cisco serial numbers are LLLYYWWXXXX
     # LLL = Location code (3 letters)
     # YY = Year code (2 digits)
@@ -294,76 +920,58 @@ def get_cisco_model_name(serial_number):
     # XXXX = Sequential serial number (4 digits/letters)
 
     # We use the Location Code (LLL) for a very rough inference of the product type/model family
-    prefix = serial_number[:3].upper()
-
-    # This mapping is highly speculative and based on common Cisco codes.
-    # It should be treated as a strong suggestion, not a definitive answer.
-    prefix_to_model = {
-        # Common Cisco Manufacturing Locations (LLL) - often associated with product lines
-        "FOX": "Cisco Product (Foxconn - Common for Switches/Routers)",
-        "FOC": "Cisco Product (China - Common for Switches/Routers)",
-        "JAE": "Cisco Product (Japan - Older/Specialized Gear)",
-        "JAB": "Cisco Product (Japan - Older/Specialized Gear)",
-        "KWC": "Cisco Product (Common for Access Points/Smaller Devices)",
-        # You would typically need a much larger, proprietary database for accurate mapping
-        # For a simple inventory, we can only suggest the product family.
-    }
-
-    if prefix in prefix_to_model:
-        model = prefix_to_model[prefix]
-        return model, f"Model inferred from serial number location code '{prefix}'. Please verify."
+    for prefix, model in CISCO_PREFIX:
+        if serial_number.startswith(prefix):
+            return model, f"Model inferred from serial number location code '{prefix}'. Please verify."
     
     return "Cisco Network Device (Inferred)", "Model inferred from serial number structure. Please verify."
 
+@functools.lru_cache(maxsize=4096)
 def get_tcl_model_name(serial_number):
     """
     Infers the TCL model name based on known serial number structure.
     TCL serial numbers are typically 12-14 characters.
     """
-    if not TCL_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid TCL Serial Number format (must be 12-14 alphanumeric characters)."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # TCL serial numbers are highly variable. We will use a generic inferred name.
     # The serial number is often used for warranty, but not directly for model lookup without an internal tool.
     
     return "TCL TV/Display (Inferred)", "Model inferred from serial number structure. Please verify."
 
+# This mapping is highly simplified and should be expanded based on local inventory
+# Vizio model numbers are more reliably found on the back of the unit.
+VIZIO_PREFIX = types.MappingProxyType({
+    "LTMA": "Vizio M-Series TV (Inferred)",
+    "LTAS": "Vizio E-Series TV (Inferred)",
+    "LTJZ": "Vizio V-Series TV (Inferred)",
+    "LTJA": "Vizio D-Series TV (Inferred)",
+})
+
+@functools.lru_cache(maxsize=4096)
 def get_vizio_model_name(serial_number):
     """
     Infers the Vizio model name based on known serial number structure.
     Vizio serial numbers are 14 characters. The first 4 characters are often a code.
     """
-    if not VIZIO_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Vizio Serial Number format (must be 14 alphanumeric characters)."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # Vizio serial numbers often start with a code that indicates the product line/factory
     prefix = serial_number[:4]
 
-    # This mapping is highly simplified and should be expanded based on local inventory
-    # Vizio model numbers are more reliably found on the back of the unit.
-    model_map = {
-        "LTMA": "Vizio M-Series TV (Inferred)",
-        "LTAS": "Vizio E-Series TV (Inferred)",
-        "LTJZ": "Vizio V-Series TV (Inferred)",
-        "LTJA": "Vizio D-Series TV (Inferred)",
-    }
-
-    model = model_map.get(prefix)
+    model = VIZIO_PREFIX.get(prefix)
 
     if model:
         return model, f"Model inferred from serial number prefix '{prefix}'. Please verify."
     
     return "Vizio Display/TV (Inferred)", "Model inferred from serial number structure. Please verify."
 
+@functools.lru_cache(maxsize=4096)
 def get_samsung_model_name(serial_number):
     """
     Scrapes the Samsung support page to find the product model name.
     NOTE: Samsung's public warranty check is often heavily protected or requires model code.
     We will use a pattern-matching fallback based on the serial number structure.
     """
-    if not SAMSUNG_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Samsung Serial Number format (must be 11 or 15 alphanumeric characters)."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # Fallback to pattern matching based on serial number structure
     # The 4th digit often indicates the year, and the 5th the month for 11-digit serials.
     # The 8th and 9th digits for 15-digit serials.
@@ -371,13 +979,12 @@ def get_samsung_model_name(serial_number):
     # Since reliable scraping is near-impossible without a full browser, we will simply return a generic name.
     return "Samsung Device (Inferred)", "Model inferred from serial number structure. Please verify."
 
+@functools.lru_cache(maxsize=4096)
 def get_microsoft_model_name(serial_number):
     """
     Scrapes the Microsoft Surface warranty check page to find the product model name.
     """
-    if not MICROSOFT_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Microsoft Serial Number format (must be 12 or 16 digits/letters)."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # Microsoft's official warranty check page
     url = "https://mybusinessservice.surface.com/en-US/CheckWarranty/CheckWarranty"
     
@@ -396,188 +1003,186 @@ def get_microsoft_model_name(serial_number):
     # Since reliable scraping is near-impossible without a full browser, we will simply return a generic name.
     return "Microsoft Surface Device (Inferred)", "Model inferred from serial number structure. Please verify."
 
+# This mapping is based on common APC product lines
+APC_PREFIX = types.MappingProxyType({
+    "AS": "APC Smart-UPS (Rack/Tower)",
+    "AP": "APC Power Distribution Unit (PDU)",
+    "BB": "APC Back-UPS (Basic Battery Backup)",
+    "BK": "APC Back-UPS (Basic Battery Backup)",
+    "SM": "APC Smart-UPS (Older Models)",
+    "SU": "APC Smart-UPS (Older Models)",
+    "SY": "APC Symmetra (Modular UPS)",
+})
+
+@functools.lru_cache(maxsize=4096)
 def get_apc_model_name(serial_number):
     """
     Infers the APC model name based on the serial number structure.
     APC serials are typically 12 characters. The first two characters often indicate the product line.
     """
-    if not APC_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid APC Serial Number format (must be 12 alphanumeric characters)."
-
-    prefix = serial_number[:2].upper()
-
-    # This mapping is based on common APC product lines
-    prefix_to_model = {
-        "AS": "APC Smart-UPS (Rack/Tower)",
-        "AP": "APC Power Distribution Unit (PDU)",
-        "BB": "APC Back-UPS (Basic Battery Backup)",
-        "BK": "APC Back-UPS (Basic Battery Backup)",
-        "SM": "APC Smart-UPS (Older Models)",
-        "SU": "APC Smart-UPS (Older Models)",
-        "SY": "APC Symmetra (Modular UPS)",
-    }
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
+    prefix = serial_number[:2]
 
-    if prefix in prefix_to_model:
-        model = prefix_to_model[prefix]
+    model = APC_PREFIX.get(prefix)
+    if model is not None:
         return model, f"Model inferred from serial number prefix '{prefix}'. Please verify."
     
     return "APC UPS/Power Device (Inferred)", "Model inferred from serial number structure. Please verify."
 
-def get_acer_model_name(serial_number):
+# Message _scrape_acer_model_name() returns when the page loaded but had no model element
+ACER_ELEMENT_NOT_FOUND = "Model name element not found on Acer support page."
+
+@ttl_memo(LOOKUP_CACHE)
+@collapse
+def _scrape_acer_model_name(serial_number):
     """
     Scrapes the Acer support page to find the product model name.
     """
-    if not ACER_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Acer Serial Number/SNID format (must be 22 alphanumeric or 11/12 digit SNID)."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # URL to scrape (Acer's official support page for serial number lookup)
     # This URL is a common target for scraping product info
     url = f"https://www.acer.com/us-en/support/product-support/serial-number-lookup?sn={serial_number}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-
         # Acer's product name is usually in a prominent h1 or h2 tag on the support page
         # We need to find the specific element that contains the model name.
         # This is a common pattern for product pages:
-        model_element = soup.find('h1', class_='product-name') or soup.find('h2', class_='product-name')
-        
-        if model_element:
-            model_name = model_element.text.strip()
-            if model_name:
-                return model_name, "Model found via web scraping."
-        
+        model_name, _, rejection = _fetch_model(url, _ACER_MATCH, element_re=_ACER_ELEMENT_RE)
+        if rejection:
+            return None, rejection
+        if model_name:
+            return model_name, "Model found via web scraping."
+        return None, ACER_ELEMENT_NOT_FOUND
+
+    except requests.exceptions.RequestException as err:
+        return None, _request_error_message(err)
+
+def get_acer_model_name(serial_number):
+    """
+    Looks up an Acer model name, inferring one from the serial number when the support page
+    could not be fetched or had no model element. The inference is made here, outside the
+    memoized scraper, so a guess is never cached as a successful lookup.
+    """
+    model_name, message = _scrape_acer_model_name(serial_number)
+    if model_name:
+        return model_name, message
+
+    if message == ACER_ELEMENT_NOT_FOUND:
         # Fallback to pattern matching if scraping is blocked or structure changed
         if len(serial_number) == 22:
             # Placeholder for pattern matching logic if scraping fails
             return f"Acer Product (Serial: {serial_number[:5]}...)", "Model inferred from serial number prefix. Please verify."
-
-        return None, "Model name element not found on Acer support page."
-
-    except requests.exceptions.RequestException as e:
-        # Fallback to pattern matching if request fails (e.g., blocked)
-        if len(serial_number) == 22:
-            return f"Acer Product (Serial: {serial_number[:5]}...)", "Model inferred from serial number prefix (Web scraping failed). Please verify."
-        elif len(serial_number) >= 11 and serial_number.isdigit():
-            return f"Acer Product (SNID: {serial_number})", "Model inferred from SNID (Web scraping failed). Please verify."
-        
-        return None, f"Request failed: {e}"
-
+        return None, message
+
+    # Fallback to pattern matching if request fails (e.g., blocked). A vendor 404 lands here
+    # too: the scraper's not-found result is still cached, but the user gets the inference.
+    if len(serial_number) == 22:
+        return f"Acer Product (Serial: {serial_number[:5]}...)", "Model inferred from serial number prefix (Web scraping failed). Please verify."
+    elif len(serial_number) >= 11 and serial_number.isdigit():
+        return f"Acer Product (SNID: {serial_number})", "Model inferred from SNID (Web scraping failed). Please verify."
+
+    return None, message
+
+# This mapping is based on common Brother serial number prefixes.
+# This is an educated guess/inference, not a definitive lookup.
+# The actual model must be verified by the user.
+BROTHER_PREFIX = types.MappingProxyType({
+    # Common Laser Printer Series (Example prefixes)
+    "U6": "Brother HL-L Series Laser Printer",
+    "E6": "Brother MFC-L Series All-in-One",
+    "K6": "Brother DCP-L Series All-in-One",
+    # Common Inkjet Series (Example prefixes)
+    "D6": "Brother MFC-J Series Inkjet",
+    "J6": "Brother DCP-J Series Inkjet",
+})
+
+@functools.lru_cache(maxsize=4096)
 def get_brother_model_name(serial_number):
     """
     Infers the Brother model name based on known serial number prefixes.
     Since Brother does not offer a public API, this uses pattern matching.
     The first few characters often indicate the product line.
     """
-    if not BROTHER_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Brother Serial Number format (must be 15 alphanumeric characters)."
-
-    # This mapping is based on common Brother serial number prefixes.
-    # This is an educated guess/inference, not a definitive lookup.
-    # The actual model must be verified by the user.
-    prefix_to_model = {
-        # Common Laser Printer Series (Example prefixes)
-        "U6": "Brother HL-L Series Laser Printer",
-        "E6": "Brother MFC-L Series All-in-One",
-        "K6": "Brother DCP-L Series All-in-One",
-        # Common Inkjet Series (Example prefixes)
-        "D6": "Brother MFC-J Series Inkjet",
-        "J6": "Brother DCP-J Series Inkjet",
-    }
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # Use the first two characters as a prefix for a simple lookup
-    prefix = serial_number[:2].upper()
+    prefix = serial_number[:2]
 
-    if prefix in prefix_to_model:
-        model = prefix_to_model[prefix]
+    model = BROTHER_PREFIX.get(prefix)
+    if model is not None:
         return model, f"Model inferred from serial number prefix '{prefix}'. Please verify."
     
     return None, "Could not infer Brother model from serial number prefix."
 
+# This mapping is based on common CyberPower serial number prefixes (2 or 3 characters, upper-case).
+# This is an educated guess/inference, not a definitive lookup.
+# The actual model must be verified by the user.
+CYBERPOWER_PREFIX = types.MappingProxyType({
+    # Common UPS Series (Example prefixes)
+    "CP": "CyberPower CP Series UPS",
+    "PR": "CyberPower PR Series UPS",
+    "OR": "CyberPower OR Series UPS",
+    "BP": "CyberPower Battery Pack",
+    # You can add more specific mappings here based on your inventory
+    "CP1": "CyberPower CP1500PFCLCD",
+    "CP2": "CyberPower CP1000PFCLCD",
+})
+# (prefix, model) pairs, longest prefix first so the most specific mapping wins
+_CYBERPOWER_PREFIXES = tuple(sorted(CYBERPOWER_PREFIX.items(), key=lambda item: -len(item[0])))
+
+@functools.lru_cache(maxsize=4096)
 def get_cyberpower_model_name(serial_number):
     """
     Infers the CyberPower model name based on known serial number prefixes.
     Since CyberPower does not offer a public API, this uses pattern matching.
     The first 3 characters often indicate the product line/model family.
     """
-    if not CYBERPOWER_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid CyberPower Serial Number format (must be 12 or 16 alphanumeric characters)."
-
-    # This mapping is based on common CyberPower serial number prefixes.
-    # This is an educated guess/inference, not a definitive lookup.
-    # The actual model must be verified by the user.
-    prefix_to_model = {
-        # Common UPS Series (Example prefixes)
-        "CP": "CyberPower CP Series UPS",
-        "PR": "CyberPower PR Series UPS",
-        "OR": "CyberPower OR Series UPS",
-        "BP": "CyberPower Battery Pack",
-        # You can add more specific mappings here based on your inventory
-        "CP1": "CyberPower CP1500PFCLCD",
-        "CP2": "CyberPower CP1000PFCLCD",
-    }
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # Use the first two or three characters as a prefix for a simple lookup
-    # Try 3 characters first for more specificity
-    prefix3 = serial_number[:3].upper()
-    prefix2 = serial_number[:2].upper()
-
-    if prefix3 in prefix_to_model:
-        model = prefix_to_model[prefix3]
-        return model, f"Model inferred from serial number prefix '{prefix3}'. Please verify."
-    elif prefix2 in prefix_to_model:
-        model = prefix_to_model[prefix2]
-        return model, f"Model inferred from serial number prefix '{prefix2}'. Please verify."
+    # 3-character prefixes are tried first for more specificity
+    for prefix, model in _CYBERPOWER_PREFIXES:
+        if serial_number.startswith(prefix):
+            return model, f"Model inferred from serial number prefix '{prefix}'. Please verify."
     
     return None, "Could not infer CyberPower model from serial number prefix."
 
+# This mapping is based on common Juniper serial number prefixes for EX series.
+# This is an educated guess/inference, not a definitive lookup.
+# The actual model must be verified by the user.
+JUNIPER_PREFIX = (
+    # EX4100 Series (Example prefixes - highly speculative without official docs)
+    ("AA", "EX4100-24P"),
+    ("AB", "EX4100-48P"),
+    ("AC", "EX4100-24T"),
+    ("AD", "EX4100-48T"),
+    # EX4300 Series (Example prefixes)
+    ("BA", "EX4300-24P"),
+    ("BB", "EX4300-48P"),
+    # EX2300 Series (Example prefixes)
+    ("CA", "EX2300-24P"),
+    ("CB", "EX2300-48P"),
+)
+
+@functools.lru_cache(maxsize=4096)
 def get_juniper_model_name(serial_number):
     """
     Infers the Juniper model name based on known serial number prefixes (not a scrape).
     Since public Juniper serial-to-model APIs are not available, this uses pattern matching.
     """
-    if not JUNIPER_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid Juniper Serial Number format (must be 12 alphanumeric characters)."
-
-    # This mapping is based on common Juniper serial number prefixes for EX series.
-    # This is an educated guess/inference, not a definitive lookup.
-    # The actual model must be verified by the user.
-    prefix_to_model = {
-        # EX4100 Series (Example prefixes - highly speculative without official docs)
-        "AA": "EX4100-24P",
-        "AB": "EX4100-48P",
-        "AC": "EX4100-24T",
-        "AD": "EX4100-48T",
-        # EX4300 Series (Example prefixes)
-        "BA": "EX4300-24P",
-        "BB": "EX4300-48P",
-        # EX2300 Series (Example prefixes)
-        "CA": "EX2300-24P",
-        "CB": "EX2300-48P",
-    }
-
-    # Use the first two characters as a prefix for a simple lookup
-    prefix = serial_number[:2].upper()
-
-    if prefix in prefix_to_model:
-        model = prefix_to_model[prefix]
-        return model, f"Model inferred from serial number prefix '{prefix}'. Please verify."
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
+    # Match the first two characters against the known prefixes
+    for prefix, model in JUNIPER_PREFIX:
+        if serial_number.startswith(prefix):
+            return model, f"Model inferred from serial number prefix '{prefix}'. Please verify."
     
     return None, "Could not infer Juniper model from serial number prefix."
 
+@ttl_memo(LOOKUP_CACHE)
+@collapse
 def get_viewsonic_model_name(serial_number):
     """
     Scrapes the ViewSonic support page for the product model name using the serial number.
     """
-    if not VIEWSONIC_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid ViewSonic Serial Number format."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # ViewSonic support URL structure for product lookup (Warranty Check page)
     # Note: ViewSonic's site is very difficult to scrape with a simple GET request.
     # We will try a common pattern for product info pages, but this may require
@@ -586,576 +1191,206 @@ def get_viewsonic_model_name(serial_number):
     # to a product page if the serial is valid.
     url = f"https://www.viewsonic.com/us/viewsonic-warranty-lookup?serial_number={serial_number}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as errh:
-        if response.status_code == 404:
-            return None, "Serial Number found, but product page not found (404). It might be too old or invalid."
-        return None, f"HTTP Error: {errh}"
-    except requests.exceptions.ConnectionError as errc:
-        return None, f"Error Connecting: {errc}"
-    except requests.exceptions.Timeout as errt:
-        return None, f"Timeout Error: {errt}"
+        model_name, from_title, rejection = _fetch_model(url, _VIEWSONIC_MATCH, _VIEWSONIC_TITLE_RE, _VIEWSONIC_ELEMENT_RE)
     except requests.exceptions.RequestException as err:
-        return None, f"An unexpected error occurred: {err}"
-
-    soup = BeautifulSoup(response.content, 'html.parser')
+        return None, _request_error_message(err)
+    if rejection:
+        return None, rejection
 
     # ViewSonic model name scraping logic (highly dependent on current site structure)
-    # We will look for a common pattern: a large heading or a span with product info.
-    
-    # Attempt 1: Look for the main product name in a specific element
-    product_name_element = soup.find('h1', class_='product-name')
-    if not product_name_element:
-        product_name_element = soup.find('span', class_='model-name') # Placeholder class
-
-    if product_name_element:
-        model_name = product_name_element.text.strip()
+    # The page title (e.g., "ViewSonic IFP6550 Product Support") is checked first, straight from
+    # the raw page bytes. Otherwise we look for a common pattern: a large heading or a span with
+    # product info (h1.product-name or span.model-name, a placeholder class).
+    if model_name and from_title:
+        return model_name, "Model name scraped from page title."
+    if model_name:
         return model_name, "Model name scraped successfully."
-    
-    # Attempt 2: Fallback to the page title
-    title_tag = soup.find('title')
-    if title_tag and 'ViewSonic' in title_tag.text:
-        # Try to extract the model from the title (e.g., "ViewSonic IFP6550 Product Support")
-        match = re.search(r'ViewSonic\s+([A-Z0-9]+)\s+Product', title_tag.text)
-        if match:
-            model_name = match.group(1).strip()
-            if model_name:
-                return model_name, "Model name scraped from page title (fallback)."
 
     return None, "Could not find the product model name on the page."
 
+@ttl_memo(LOOKUP_CACHE)
+@collapse
 def get_hp_model_name(serial_number):
     """
     Scrapes the HP support page for the product model name using the serial number.
     """
-    if not HP_SERIAL_REGEX.match(serial_number):
-        return None, "Invalid HP Serial Number format."
-
+    # precondition: serial_number is validated and ASCII uppercase (see _normalize/validate)
     # HP support URL structure for product lookup
     url = f"https://support.hp.com/us-en/product/lookup/{serial_number}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as errh:
-        if response.status_code == 404:
-            return None, "Serial Number found, but product page not found (404). It might be too old or invalid."
-        return None, f"HTTP Error: {errh}"
-    except requests.exceptions.ConnectionError as errc:
-        return None, f"Error Connecting: {errc}"
-    except requests.exceptions.Timeout as errt:
-        return None, f"Timeout Error: {errt}"
+        model_name, from_title, rejection = _fetch_model(url, _HP_MATCH, _HP_TITLE_RE, _HP_ELEMENT_RE)
     except requests.exceptions.RequestException as err:
-        return None, f"An unexpected error occurred: {err}"
+        return None, _request_error_message(err)
+    if rejection:
+        return None, rejection
 
-    soup = BeautifulSoup(response.content, 'html.parser')
-
-    # The HP model name is typically in a prominent header tag or a specific data attribute.
-    # Look for the main product name element.
-    
-    # Attempt 1: Look for the main product name in a specific element (e.g., h1 or span with a specific class/id)
+    # The page title ("<model> | HP Product Information") is checked first, straight from the
+    # raw page bytes. Otherwise the HP model name is typically in a prominent header tag:
     # HP's site structure is complex and changes often. We will look for a common pattern:
-    # a large heading or a span with product info.
-    product_name_element = soup.find('h1', class_='product-title') # Common class
-    if not product_name_element:
-        product_name_element = soup.find('span', class_='product-name') # Another common class
-
-    if product_name_element:
-        model_name = product_name_element.text.strip()
+    # a large heading or a span with product info (h1.product-title or span.product-name).
+    if model_name and from_title:
+        return model_name, "Model name scraped from page title."
+    if model_name:
         # Clean up the model name (remove unnecessary prefixes/suffixes)
-        model_name = re.sub(r'^HP\s+', '', model_name, flags=re.IGNORECASE).strip()
+        model_name = _strip_hp_prefix(model_name)
         return model_name, "Model name scraped successfully."
-    
-    # Attempt 2: Fallback to the page title
-    title_tag = soup.find('title')
-    if title_tag and 'HP Product Information' in title_tag.text:
-        # Extract the part before " | HP Product Information"
-        match = re.search(r'(.+?)\s+\|\s+HP Product Information', title_tag.text)
-        if match:
-            model_name = match.group(1).strip()
-            if model_name:
-                return model_name, "Model name scraped from page title (fallback)."
 
     return None, "Could not find the product model name on the page."
 
+@ttl_memo(LOOKUP_CACHE)
+@collapse
 def get_dell_model_name(service_tag):
     """
     Scrapes the Dell support page for the product model name using the service tag.
     """
-    if not SERVICE_TAG_REGEX.match(service_tag):
-        return None, "Invalid Dell Service Tag format."
-
+    # precondition: service_tag is validated and ASCII uppercase (see _normalize/validate)
     # Dell support URL structure
     url = f"https://www.dell.com/support/home/en-us/product-support/servicetag/{service_tag}/overview"
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
-    except requests.exceptions.HTTPError as errh:
-        if response.status_code == 404:
-            return None, "Service Tag found, but product page not found (404). It might be too old or invalid."
-        return None, f"HTTP Error: {errh}"
-    except requests.exceptions.ConnectionError as errc:
-        return None, f"Error Connecting: {errc}"
-    except requests.exceptions.Timeout as errt:
-        return None, f"Timeout Error: {errt}"
+        model_name, from_title, rejection = _fetch_model(url, _DELL_MATCH, _DELL_TITLE_RE, _DELL_ELEMENT_RE)
     except requests.exceptions.RequestException as err:
-        return None, f"An unexpected error occurred: {err}"
-
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
-    # The product name is typically in a prominent header tag with a specific class or structure.
-    # Common selectors for the model name:
-    # 1. The main product title/name on the overview page.
-    # 2. A specific data attribute.
-    
-    # Let's try to find the main product name element.
-    # A common pattern is a large heading (h1 or h2) that contains the product name.
-    # We'll look for a few common identifiers.
-    
-    # Attempt 1: Look for the product name in a specific div/span
-    product_name_element = soup.find('h1', class_='product-name') # Common Dell support class
-    if not product_name_element:
-        # Attempt 2: Look for the product name in the main product info section
-        product_name_element = soup.find('span', id='modelName') # Another possible ID
-    if not product_name_element:
-        # Attempt 3: Look for the model name in the page title (less reliable but a fallback)
-        title_tag = soup.find('title')
-        if title_tag and 'Support for' in title_tag.text:
-            # Extract the part after "Support for " and before " | Dell US"
-            match = re.search(r'Support for (.+?) \| Dell US', title_tag.text)
-            if match:
-                model_name = match.group(1).strip()
-                if model_name:
-                    return model_name, "Model name scraped from page title (fallback)."
-    
-    if product_name_element:
-        model_name = product_name_element.text.strip()
+        return None, _request_error_message(err, SERVICE_TAG_NOT_FOUND)
+    if rejection:
+        return None, rejection
+
+    # The page title ("Support for <model> | Dell US") is checked first, straight from the raw
+    # page bytes. Otherwise the product name is typically in a prominent header tag with a
+    # specific class or structure: h1.product-name (common Dell support class) or
+    # span#modelName (main product info section).
+    if model_name and from_title:
+        return model_name, "Model name scraped from page title."
+    if model_name:
         # Clean up the model name (remove "Support for" prefix if present)
-        model_name = re.sub(r'^Support for\s+', '', model_name, flags=re.IGNORECASE).strip()
+        model_name = _DELL_PREFIX_RE.sub('', model_name).strip()
         return model_name, "Model name scraped successfully."
     
     return None, "Could not find the product model name on the page."
 
 
-@app.route('/lookup/dell', methods=['GET'])
-@login_required
-def lookup_dell_service_tag():
-    service_tag = request.args.get('tag', '').upper()
-    
-    if not service_tag:
-        return jsonify({'error': 'Missing service tag parameter.'}), 400
-
-    if not SERVICE_TAG_REGEX.match(service_tag):
-        return jsonify({'error': 'Invalid Dell Service Tag format (must be 7 alphanumeric characters).'}), 400
-
-    model_name, message = get_dell_model_name(service_tag)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'service_tag': service_tag,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'service_tag': service_tag,
-            'error': message
-        }), 404
-
-@app.route('/lookup/tcl', methods=['GET'])
-@login_required
-def lookup_tcl_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not TCL_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid TCL Serial Number format.'}), 400
-
-    model_name, message = get_tcl_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
-
-@app.route('/lookup/vizio', methods=['GET'])
-@login_required
-def lookup_vizio_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not VIZIO_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Vizio Serial Number format.'}), 400
-
-    model_name, message = get_vizio_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
-
-@app.route('/lookup/samsung', methods=['GET'])
-@login_required
-def lookup_samsung_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not SAMSUNG_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Samsung Serial Number format.'}), 400
-
-    model_name, message = get_samsung_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
-
-@app.route('/lookup/microsoft', methods=['GET'])
-@login_required
-def lookup_microsoft_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not MICROSOFT_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Microsoft Serial Number format.'}), 400
-
-    model_name, message = get_microsoft_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
-
-@app.route('/lookup/apc', methods=['GET'])
-@login_required
-def lookup_apc_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not APC_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid APC Serial Number format.'}), 400
-
-    model_name, message = get_apc_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
-
-@app.route('/lookup/cisco', methods=['GET'])
-@login_required
-def lookup_cisco_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not CISCO_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Cisco Serial Number format.'}), 400
-
-    model_name, message = get_cisco_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
-
-@app.route('/lookup/lenovo', methods=['GET'])
-@login_required
-def lookup_lenovo_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not LENOVO_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Lenovo Serial Number format.'}), 400
-
-    model_name, message = get_lenovo_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
+# --- LOOKUP ROUTES ---
+
+# Vendor -> (model lookup function, response key for the tag, missing-tag error, invalid-tag error)
+VENDORS = {
+    'dell': (get_dell_model_name, 'service_tag', 'Missing service tag parameter.', 'Invalid Dell Service Tag format (must be 7 alphanumeric characters).'),
+    'tcl': (get_tcl_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid TCL Serial Number format.'),
+    'vizio': (get_vizio_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Vizio Serial Number format.'),
+    'samsung': (get_samsung_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Samsung Serial Number format.'),
+    'microsoft': (get_microsoft_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Microsoft Serial Number format.'),
+    'apc': (get_apc_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid APC Serial Number format.'),
+    'cisco': (get_cisco_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Cisco Serial Number format.'),
+    'lenovo': (get_lenovo_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Lenovo Serial Number format.'),
+    'acer': (get_acer_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Acer Serial Number/SNID format.'),
+    'apple': (get_apple_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Apple Serial Number format (must be 12 or 17 alphanumeric characters).'),
+    'brother': (get_brother_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Brother Serial Number format (must be 15 alphanumeric characters).'),
+    'cyberpower': (get_cyberpower_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid CyberPower Serial Number format (must be 12 or 16 alphanumeric characters).'),
+    'juniper': (get_juniper_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid Juniper Serial Number format (must be 12 alphanumeric characters).'),
+    'viewsonic': (get_viewsonic_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid ViewSonic Serial Number format (must be 10-12 alphanumeric characters).'),
+    'hp': (get_hp_model_name, 'serial_number', 'Missing serial number parameter.', 'Invalid HP Serial Number format (must be 10-12 alphanumeric characters).'),
+}
+
+# Pre-serialized error bodies, so rejected requests skip JSON encoding entirely.
+# A fresh Response is still built per request because CORS adds headers to it.
+def lookup_device(vendor, tag):
+    """
+    Validates, normalizes and looks up one tag for a supported vendor. Shared by the
+    single and batch lookup routes; returns (payload, HTTP status).
+    """
+    get_model_name, tag_key, missing_error, invalid_error = VENDORS[vendor]
 
-@app.route('/lookup/acer', methods=['GET'])
-@login_required
-def lookup_acer_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
+    if not tag:
+        return {'success': False, 'error': missing_error}, 400
 
-    if not ACER_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Acer Serial Number/SNID format.'}), 400
+    if not validate(vendor, tag):
+        return {'success': False, tag_key: tag, 'error': invalid_error}, 400
+    tag = _normalize(tag)
 
-    model_name, message = get_acer_model_name(serial_number)
+    model_name, message = get_model_name(tag)
 
     if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
+        return {'success': True, tag_key: tag, 'model_name': model_name, 'message': message}, 200
+    return {'success': False, tag_key: tag, 'error': message}, 404
 
-@app.route('/lookup/apple', methods=['GET'])
+@app.route('/lookup/<vendor>', methods=['GET'])
 @login_required
-def lookup_apple_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not APPLE_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Apple Serial Number format (must be 12 or 17 alphanumeric characters).'}), 400
-
-    model_name, message = get_apple_model_name(serial_number)
+def lookup_vendor(vendor):
+    """Looks up a single device: /lookup/<vendor>?tag=<serial number or service tag>."""
+    if vendor not in VENDORS:
+        return ojsonify({'error': 'Unsupported vendor.'}, status=404)
+    payload, status = lookup_device(vendor, request.args.get('tag', ''))
+    return ojsonify(payload, status=status)
 
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
-
-@app.route('/lookup/brother', methods=['GET'])
-@login_required
-def lookup_brother_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
+# --- BATCH LOOKUP ---
 
-    if not BROTHER_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Brother Serial Number format (must be 15 alphanumeric characters).'}), 400
+# Maximum number of items accepted per batch request (protects the upstream vendor sites)
+MAX_BATCH_ITEMS = 200
 
-    model_name, message = get_brother_model_name(serial_number)
+# Lookups are network-bound, so a shared thread pool overlaps the vendor round-trips
+BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=32)
 
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
+def lookup_batch_item(item):
+    """
+    Looks up a single batch item ({"vendor": ..., "tag": ...}) and returns
+    the same payload the matching /lookup/<vendor> route would, plus the vendor.
+    """
+    if not isinstance(item, dict):
+        return {'success': False, 'error': 'Each item must be an object with "vendor" and "tag".'}
 
-@app.route('/lookup/cyberpower', methods=['GET'])
-@login_required
-def lookup_cyberpower_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
+    vendor = item.get('vendor', '')
+    tag = item.get('tag', '')
 
-    if not CYBERPOWER_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid CyberPower Serial Number format (must be 12 or 16 alphanumeric characters).'}), 400
+    if not isinstance(vendor, str) or vendor not in VENDORS:
+        return {'success': False, 'vendor': vendor, 'error': 'Unsupported vendor.'}
 
-    model_name, message = get_cyberpower_model_name(serial_number)
+    if not isinstance(tag, str):
+        return {'success': False, 'vendor': vendor, 'error': 'Tag must be a string.'}
 
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
+    payload, _ = lookup_device(vendor, tag)
+    payload['vendor'] = vendor
+    return payload
 
-@app.route('/lookup/juniper', methods=['GET'])
+@app.route('/lookup/batch', methods=['POST'])
 @login_required
-def lookup_juniper_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not JUNIPER_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid Juniper Serial Number format (must be 12 alphanumeric characters).'}), 400
-
-    model_name, message = get_juniper_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
+def lookup_batch():
+    """
+    Looks up several devices in one request.
+    Expects a JSON body of the form {"items": [{"vendor": "dell", "tag": "ABC1234"}, ...]}
+    and returns {"results": [...]} in the same order as the items.
+    """
+    payload = request.get_json(silent=True)
+    items = payload.get('items') if isinstance(payload, dict) else None
 
-@app.route('/lookup/viewsonic', methods=['GET'])
-@login_required
-def lookup_viewsonic_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
+    if not isinstance(items, list) or not items:
+        return ojsonify({'error': 'Missing items list.'}, status=400)
 
-    if not VIEWSONIC_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid ViewSonic Serial Number format (must be 10-12 alphanumeric characters).'}), 400
+    if len(items) > MAX_BATCH_ITEMS:
+        return ojsonify({'error': f'Too many items (maximum is {MAX_BATCH_ITEMS}).'}, status=400)
 
-    model_name, message = get_viewsonic_model_name(serial_number)
+    results = list(BATCH_EXECUTOR.map(lookup_batch_item, items))
+    return ojsonify({'results': results})
 
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
+# --- CACHE STATS ---
 
-@app.route('/lookup/hp', methods=['GET'])
+@app.route('/cache/stats', methods=['GET'])
 @login_required
-def lookup_hp_serial_number():
-    serial_number = request.args.get('tag', '').upper()
-    
-    if not serial_number:
-        return jsonify({'error': 'Missing serial number parameter.'}), 400
-
-    if not HP_SERIAL_REGEX.match(serial_number):
-        return jsonify({'error': 'Invalid HP Serial Number format (must be 10-12 alphanumeric characters).'}), 400
-
-    model_name, message = get_hp_model_name(serial_number)
-
-    if model_name:
-        return jsonify({
-            'success': True,
-            'serial_number': serial_number,
-            'model_name': model_name,
-            'message': message
-        })
-    else:
-        return jsonify({
-            'success': False,
-            'serial_number': serial_number,
-            'error': message
-        }), 404
+def cache_stats():
+    """Reports hit/miss counters for the scraper caches (in-memory and on-disk) and the memoized pattern-matching helpers."""
+    with _CACHE_LOCK:
+        scrapers = dict(
+            CACHE_STATS,
+            size=len(LOOKUP_CACHE),
+            negative_size=len(NEG_CACHE),
+            not_found_size=len(NOT_FOUND_CACHE),
+        )
+    scrapers['disk_size'] = len(DISK_CACHE) if DISK_CACHE is not None else None
+    helpers = {}
+    for vendor, (get_model_name, _, _, _) in VENDORS.items():
+        if hasattr(get_model_name, 'cache_info'):
+            info = get_model_name.cache_info()
+            helpers[vendor] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize}
+    return ojsonify({'scrapers': scrapers, 'helpers': helpers})
 
 # The home route is now the secure serve_app route.
 # The old home route content is no longer needed but we can keep a simple status check.
@@ -1164,6 +1399,10 @@ def status():
     return "Inventory Lookup API is running and secured."
 
 if __name__ == '__main__':
+    # Flask's development server is for local testing only (FLASK_DEV=1);
+    # deployments run under gunicorn with gevent workers (see Procfile)
+    if not os.environ.get('FLASK_DEV'):
+        raise SystemExit("Run under gunicorn (see Procfile), or set FLASK_DEV=1 to use the development server.")
     # Use environment variable for port, common in hosting environments
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, ssl_context='adhoc') # Use adhoc for local testing over https
@@ -1,5 +1,4 @@
 import http.server
-import socketserver
 import os
 
 PORT = 8000
@@ -8,9 +7,14 @@ PORT = 8000
 # This assumes index.html is in the same directory as this script
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-Handler = http.server.SimpleHTTPRequestHandler
+class Handler(http.server.SimpleHTTPRequestHandler):
+    def copyfile(self, source, outputfile):
+        # Hand the file straight to the socket (os.sendfile where available)
+        # instead of copying it through Python in chunks
+        self.connection.sendfile(source)
 
-with socketserver.TCPServer(("", PORT), Handler) as httpd:
+# Each client gets its own (daemon) thread, so one slow download doesn't block the others
+with http.server.ThreadingHTTPServer(("", PORT), Handler) as httpd:
     print(f"Serving at http://localhost:{PORT}")
     print("Press Ctrl+C to stop the server.")
     try: